@@ -3,36 +3,53 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
+import threading
 import tkinter as tk
 from tkinter import font as tkfont
-from typing import Dict, List, Optional
+from tkinter import ttk
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 RECOGNITION_FILE = DATA_DIR / "recognition_sets.json"
 LEXICON_FILE = DATA_DIR / "lexicon.json"
+FONT_FAMILY = "Segoe UI"
+
+NORMAL = tk.NORMAL
+DISABLED = tk.DISABLED
+
+MAX_PREFIX_CANDIDATES = 5
+
+SUMMARY_TEMPLATE = "Reconnaissance :\n{rec}\n\nSaisie en glyphes :\n{tr}"
 
 
 # ----------------------------
 # Data handling
 # ----------------------------
 
+def write_fallback(path: Path, fallback: dict) -> dict:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(fallback, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        path.write_text(json.dumps(fallback, ensure_ascii=False, indent=2), encoding="utf-8")
+    return fallback
+
+
 def load_json(path: Path, fallback: dict) -> dict:
     try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         with path.open("r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(fallback, ensure_ascii=False, indent=2), encoding="utf-8")
-        return fallback
-
-
-def build_reverse_dictionary(dictionary: Dict[str, str]) -> Dict[str, str]:
-    reverse = {}
-    for french, glyphs in dictionary.items():
-        reverse[glyphs] = french
-    return reverse
+        return write_fallback(path, fallback)
 
 
 # ----------------------------
@@ -54,28 +71,51 @@ def apply_futuristic_theme(root: tk.Tk, base_font: tkfont.Font) -> None:
     root.option_add("*Font", base_font)
     root.option_add("*Foreground", Palette.text)
     root.option_add("*Background", Palette.panel)
-    root.option_add("*Button.ActiveBackground", Palette.accent_dim)
-    root.option_add("*Button.ActiveForeground", Palette.bg)
     root.option_add("*HighlightThickness", 0)
+    # Plain tk containers still take their colours from the option database.
+    root.option_add("*Frame.background", Palette.bg)
+    root.option_add("*Text.background", Palette.bg)
+
+    # Controls are ttk widgets styled once here and referenced by name.
+    style = ttk.Style(root)
+    style.theme_use("clam")
+    style.configure(".", background=Palette.panel, foreground=Palette.text, font=base_font, borderwidth=0)
+    style.configure("Header.TLabel", background=Palette.bg, foreground=Palette.accent)
+    style.configure("Muted.TLabel", background=Palette.bg, foreground=Palette.muted)
+    style.configure("PanelMuted.TLabel", foreground=Palette.muted)
+    style.configure("Feedback.TLabel", foreground=Palette.accent)
+    style.configure("Accent.TButton", background=Palette.accent, foreground=Palette.bg)
+    style.map(
+        "Accent.TButton",
+        background=[("disabled", Palette.panel_border), ("active", Palette.accent_dim)],
+        foreground=[("disabled", Palette.muted)],
+    )
+    style.configure("Muted.TButton", background=Palette.panel, foreground=Palette.muted)
+    style.map("Muted.TButton", background=[("active", Palette.panel_border)])
+    style.configure("TEntry", fieldbackground=Palette.bg, foreground=Palette.text, insertcolor=Palette.accent)
+    style.configure(
+        "Choice.Toolbutton", background=Palette.panel, foreground=Palette.text, padding=(0, 10), anchor="center"
+    )
+    style.map("Choice.Toolbutton", background=[("selected", Palette.accent_dim), ("active", Palette.panel_border)])
 
 
 # ----------------------------
 # Data classes
 # ----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RecognitionChoice:
     round_index: int
     selection: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationAttempt:
     french_word: str
     typed_glyphs: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     font_label: str = "HoloGlyph"
     recognition_rounds: List[List[str]] = field(default_factory=list)
@@ -83,9 +123,49 @@ class GameState:
     dictionary: Dict[str, str] = field(default_factory=dict)
     recognition_choices: List[RecognitionChoice] = field(default_factory=list)
     translation_attempts: List[TranslationAttempt] = field(default_factory=list)
+    # Lookup caches derived from `dictionary`. They are tied to the dict object
+    # they were built from and dropped whenever `dictionary` is reassigned;
+    # in-place edits of the dict are not tracked, so replace it instead.
+    _cached_for: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _folded: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _reverse: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _glyph_prefix: Optional[Dict[str, List[Tuple[str, str]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def set_dictionary(self, dictionary: Dict[str, str]) -> None:
+        self.dictionary = dictionary
+
+    def _sync_caches(self) -> None:
+        if self._cached_for is not self.dictionary:
+            self._cached_for = self.dictionary
+            self._folded = None
+            self._reverse = None
+            self._glyph_prefix = None
+
+    def folded_dictionary(self) -> Dict[str, str]:
+        # French lookups casefold the query; the original keys are kept in
+        # `dictionary` so glyph -> French output shows them as written.
+        self._sync_caches()
+        if self._folded is None:
+            self._folded = {french.casefold(): glyphs for french, glyphs in self.dictionary.items()}
+        return self._folded
 
     def reverse_dictionary(self) -> Dict[str, str]:
-        return build_reverse_dictionary(self.dictionary)
+        self._sync_caches()
+        if self._reverse is None:
+            self._reverse = {glyphs: french for french, glyphs in self.dictionary.items()}
+        return self._reverse
+
+    def glyph_prefix_matches(self, prefix: str) -> List[Tuple[str, str]]:
+        self._sync_caches()
+        if self._glyph_prefix is None:
+            index: Dict[str, List[Tuple[str, str]]] = {}
+            for french, glyphs in self.dictionary.items():
+                for i in range(1, len(glyphs) + 1):
+                    index.setdefault(glyphs[:i], []).append((glyphs, french))
+            self._glyph_prefix = index
+        return self._glyph_prefix.get(prefix, [])
 
 
 # ----------------------------
@@ -94,12 +174,13 @@ class GameState:
 
 class BaseFrame(tk.Frame):
     def __init__(self, master: tk.Tk, controller: "TranslationAlienApp") -> None:
-        super().__init__(master, bg=Palette.bg, highlightthickness=0)
+        super().__init__(master, highlightthickness=0)
         self.controller = controller
+        self.state = controller.state
         self.columnconfigure(0, weight=1)
 
-    def header(self, text: str) -> tk.Label:
-        return tk.Label(self, text=text, fg=Palette.accent, bg=Palette.bg, font=self.controller.heading_font)
+    def header(self, text: str) -> ttk.Label:
+        return ttk.Label(self, text=text, style="Header.TLabel", font=self.controller.heading_font)
 
     def panel(self, **kwargs) -> tk.Frame:
         frame = tk.Frame(self, bg=Palette.panel, bd=2, relief=tk.SOLID, highlightbackground=Palette.panel_border)
@@ -115,11 +196,10 @@ class StartFrame(BaseFrame):
 
     def build(self) -> None:
         self.header("Translation Alien").grid(row=0, pady=(40, 12))
-        subtitle = tk.Label(
+        subtitle = ttk.Label(
             self,
             text="Futuristic symbol trainer for your custom font",
-            fg=Palette.muted,
-            bg=Palette.bg,
+            style="Muted.TLabel",
         )
         subtitle.grid(row=1, pady=(0, 20))
 
@@ -132,96 +212,125 @@ class StartFrame(BaseFrame):
             "In Step 2, translate French prompts using your glyphs.\n"
             "Then access the live translator between your font and French."
         )
-        tk.Label(panel, text=intro, justify="left", bg=Palette.panel, fg=Palette.text, wraplength=520).grid(
+        ttk.Label(panel, text=intro, justify="left", wraplength=520).grid(
             row=0, column=0, padx=20, pady=20
         )
 
-        start = tk.Button(
+        self.start_button = ttk.Button(
             self,
             text="Commencer",
+            style="Accent.TButton",
+            state=NORMAL if self.controller.ready else DISABLED,
             command=lambda: self.controller.show_frame("recognition"),
-            bg=Palette.accent,
-            fg=Palette.bg,
-            activebackground=Palette.accent_dim,
         )
-        start.grid(row=3, pady=30, ipadx=16, ipady=8)
+        self.start_button.grid(row=3, pady=30, ipadx=16, ipady=8)
 
 
 class RecognitionFrame(BaseFrame):
     def __init__(self, master: tk.Tk, controller: "TranslationAlienApp") -> None:
         super().__init__(master, controller)
         self.selection_var = tk.StringVar(value="")
+        self.round_text = tk.StringVar(value="")
+        # One Tcl command shared by every choice button; the radiobutton has
+        # already written its value into selection_var when this fires.
+        self._choice_cmd = self.register(self.record_choice_from_var)
         self.build()
+        # Lock the choice grid to its initial size so per-round text changes
+        # don't trigger a geometry pass on the whole frame.
+        self.buttons_frame.update_idletasks()
+        self.buttons_frame.grid_propagate(False)
 
     def build(self) -> None:
         self.header("Étape 1 · Reconnaissance des glyphes").grid(row=0, pady=(30, 10))
-        self.round_label = tk.Label(self, text="", fg=Palette.muted, bg=Palette.bg)
+        self.round_label = ttk.Label(self, textvariable=self.round_text, style="Muted.TLabel")
         self.round_label.grid(row=1, pady=(0, 20))
 
-        self.buttons_frame = tk.Frame(self, bg=Palette.bg)
+        self.buttons_frame = tk.Frame(self)
         self.buttons_frame.grid(row=2, padx=20, pady=10)
 
-        self.none_button = tk.Button(
+        self.radios: List[ttk.Radiobutton] = []
+        self.add_radios(6)
+
+        self.none_button = ttk.Button(
             self,
             text="Aucun symbole reconnu",
+            style="Muted.TButton",
             command=lambda: self.record_choice("Aucun"),
-            bg=Palette.panel,
-            fg=Palette.muted,
         )
         self.none_button.grid(row=3, pady=(10, 0))
 
-        self.next_button = tk.Button(
+        self.next_button = ttk.Button(
             self,
             text="Suivant",
-            state=tk.DISABLED,
+            style="Accent.TButton",
+            state=DISABLED,
             command=self.next_round,
-            bg=Palette.accent,
-            fg=Palette.bg,
         )
         self.next_button.grid(row=4, pady=20, ipadx=10, ipady=6)
 
+    def add_radios(self, size: int) -> None:
+        for idx in range(len(self.radios), size):
+            btn = ttk.Radiobutton(
+                self.buttons_frame,
+                variable=self.selection_var,
+                style="Choice.Toolbutton",
+                width=12,
+                command=self._choice_cmd,
+            )
+            btn.grid(row=idx // 3, column=idx % 3, padx=8, pady=6)
+            self.radios.append(btn)
+        # Earlier buttons may have been hidden by render_round; force it to
+        # re-grid the pool on its next pass.
+        self._visible = -1
+
     def on_show(self) -> None:
-        self.controller.state.recognition_choices.clear()
+        self.state.recognition_choices.clear()
         self.selection_var.set("")
         self.current_round = 0
+        self._rounds = self.state.recognition_rounds
+        self._total = len(self._rounds)
+        largest = max(map(len, self._rounds), default=0)
+        if largest > len(self.radios):
+            # A user-supplied round is wider than the pool: grow it and let
+            # the grid re-measure once before locking its size again.
+            self.add_radios(largest)
+            self.buttons_frame.grid_propagate(True)
+            self.buttons_frame.update_idletasks()
+            self.buttons_frame.grid_propagate(False)
         self.render_round()
 
     def render_round(self) -> None:
-        for widget in self.buttons_frame.winfo_children():
-            widget.destroy()
-
-        total_rounds = len(self.controller.state.recognition_rounds)
-        self.round_label.configure(text=f"Série {self.current_round + 1} / {total_rounds}")
-        symbols = self.controller.state.recognition_rounds[self.current_round]
+        self.round_text.set(f"Série {self.current_round + 1} / {self._total}")
+        symbols = self._rounds[self.current_round]
         self.selection_var.set("")
-        self.next_button.config(state=tk.DISABLED)
+        self.next_button.config(state=DISABLED)
 
-        for idx, symbol in enumerate(symbols):
-            btn = tk.Radiobutton(
-                self.buttons_frame,
-                text=symbol,
-                variable=self.selection_var,
-                value=symbol,
-                indicatoron=0,
-                width=12,
-                pady=10,
-                command=lambda s=symbol: self.record_choice(s),
-                selectcolor=Palette.accent_dim,
-                bg=Palette.panel,
-                fg=Palette.text,
-            )
-            btn.grid(row=idx // 3, column=idx % 3, padx=8, pady=6)
+        for btn, symbol in zip(self.radios, symbols):
+            btn.configure(text=symbol, value=symbol)
+
+        # Only touch grid geometry when the number of choices changes.
+        count = len(symbols)
+        if count != self._visible:
+            for idx, btn in enumerate(self.radios):
+                if idx < count:
+                    btn.grid()
+                else:
+                    btn.grid_remove()
+            self._visible = count
+
+    def record_choice_from_var(self) -> None:
+        self.next_button.config(state=NORMAL)
 
     def record_choice(self, selection: str) -> None:
         self.selection_var.set(selection)
-        self.next_button.config(state=tk.NORMAL)
+        self.next_button.config(state=NORMAL)
 
     def next_round(self) -> None:
         selection = self.selection_var.get() or "Aucun"
-        self.controller.state.recognition_choices.append(
+        self.state.recognition_choices.append(
             RecognitionChoice(round_index=self.current_round + 1, selection=selection)
         )
-        if self.current_round + 1 >= len(self.controller.state.recognition_rounds):
+        if self.current_round + 1 >= self._total:
             self.controller.show_frame("translation")
         else:
             self.current_round += 1
@@ -237,38 +346,37 @@ class TranslationFrame(BaseFrame):
 
     def build(self) -> None:
         self.header("Étape 2 · Taper en glyphes").grid(row=0, pady=(30, 8))
-        self.prompt_label = tk.Label(self, text="", fg=Palette.muted, bg=Palette.bg)
+        self.prompt_label = ttk.Label(self, text="", style="Muted.TLabel")
         self.prompt_label.grid(row=1, pady=(0, 10))
 
         panel = self.panel()
         panel.grid(row=2, padx=30, pady=10, sticky="ew")
         panel.columnconfigure(0, weight=1)
 
-        tk.Label(panel, text="Saisissez la traduction avec votre police futuriste", bg=Palette.panel).grid(
+        ttk.Label(panel, text="Saisissez la traduction avec votre police futuriste").grid(
             row=0, column=0, padx=16, pady=(16, 8), sticky="w"
         )
-        entry = tk.Entry(panel, textvariable=self.input_var, relief=tk.FLAT, bg=Palette.bg, fg=Palette.text)
+        entry = ttk.Entry(panel, textvariable=self.input_var)
         entry.grid(row=1, column=0, padx=16, pady=(0, 16), sticky="ew")
         self.entry_widget = entry
 
-        self.next_button = tk.Button(
+        self.next_button = ttk.Button(
             self,
             text="Valider",
+            style="Accent.TButton",
             command=self.submit,
-            bg=Palette.accent,
-            fg=Palette.bg,
         )
         self.next_button.grid(row=3, pady=20, ipadx=12, ipady=6)
 
     def on_show(self) -> None:
         self.index = 0
-        self.controller.state.translation_attempts.clear()
+        self.state.translation_attempts.clear()
         self.load_prompt()
         self.input_var.set("")
         self.entry_widget.focus_set()
 
     def load_prompt(self) -> None:
-        words = self.controller.state.practice_words
+        words = self.state.practice_words
         if self.index >= len(words):
             self.controller.show_frame("translator")
             return
@@ -277,12 +385,12 @@ class TranslationFrame(BaseFrame):
         self.input_var.set("")
 
     def submit(self) -> None:
-        words = self.controller.state.practice_words
+        words = self.state.practice_words
         if self.index >= len(words):
             self.controller.show_frame("translator")
             return
 
-        self.controller.state.translation_attempts.append(
+        self.state.translation_attempts.append(
             TranslationAttempt(french_word=words[self.index], typed_glyphs=self.input_var.get().strip())
         )
         self.index += 1
@@ -295,6 +403,11 @@ class TranslatorFrame(BaseFrame):
         self.custom_var = tk.StringVar()
         self.french_var = tk.StringVar()
         self.feedback_var = tk.StringVar()
+        self.custom_norm = ""
+        self.french_norm = ""
+        self.custom_var.trace_add("write", self._normalize_custom)
+        self.french_var.trace_add("write", self._normalize_french)
+        self._summary_sig: Optional[tuple] = None
         self.build()
 
     def build(self) -> None:
@@ -303,17 +416,17 @@ class TranslatorFrame(BaseFrame):
         summary_panel = self.panel()
         summary_panel.grid(row=1, padx=30, pady=10, sticky="ew")
         summary_panel.columnconfigure(0, weight=1)
-        tk.Label(summary_panel, text="Vos sélections", bg=Palette.panel, fg=Palette.muted).grid(
+        ttk.Label(summary_panel, text="Vos sélections", style="PanelMuted.TLabel").grid(
             row=0, column=0, padx=16, pady=(14, 6), sticky="w"
         )
+        # A read-only Text rather than a Label: it keeps a fixed height in the
+        # non-resizable window while still scrolling to show every entry.
         self.summary_text = tk.Text(
             summary_panel,
             height=8,
             relief=tk.FLAT,
-            bg=Palette.bg,
-            fg=Palette.text,
             insertbackground=Palette.accent,
-            state=tk.DISABLED,
+            state=DISABLED,
             wrap="word",
         )
         self.summary_text.grid(row=1, column=0, padx=16, pady=(0, 14), sticky="ew")
@@ -323,53 +436,43 @@ class TranslatorFrame(BaseFrame):
         translator_panel.columnconfigure(0, weight=1)
         translator_panel.columnconfigure(1, weight=0)
 
-        tk.Label(
+        ttk.Label(
             translator_panel,
             text="Entrer un mot en glyphes (votre police)",
-            bg=Palette.panel,
-            fg=Palette.text,
         ).grid(row=0, column=0, padx=16, pady=(16, 4), sticky="w")
-        glyph_entry = tk.Entry(
+        glyph_entry = ttk.Entry(
             translator_panel,
             textvariable=self.custom_var,
-            relief=tk.FLAT,
-            bg=Palette.bg,
-            fg=Palette.text,
         )
         glyph_entry.grid(row=1, column=0, padx=16, pady=(0, 12), sticky="ew")
 
-        tk.Button(
+        ttk.Button(
             translator_panel,
             text="Traduire → Français",
+            style="Accent.TButton",
             command=self.translate_custom,
-            bg=Palette.accent,
-            fg=Palette.bg,
         ).grid(row=1, column=1, padx=(0, 16), pady=(0, 12), ipadx=8, ipady=4)
 
-        tk.Label(
+        ttk.Label(
             translator_panel,
             text="Entrer un mot en français",
-            bg=Palette.panel,
-            fg=Palette.text,
         ).grid(row=2, column=0, padx=16, pady=(10, 4), sticky="w")
-        french_entry = tk.Entry(
+        french_entry = ttk.Entry(
             translator_panel,
             textvariable=self.french_var,
-            relief=tk.FLAT,
-            bg=Palette.bg,
-            fg=Palette.text,
         )
         french_entry.grid(row=3, column=0, padx=16, pady=(0, 16), sticky="ew")
 
-        tk.Button(
+        ttk.Button(
             translator_panel,
             text="Traduire → Glyphes",
+            style="Accent.TButton",
             command=self.translate_french,
-            bg=Palette.accent,
-            fg=Palette.bg,
         ).grid(row=3, column=1, padx=(0, 16), pady=(0, 16), ipadx=8, ipady=4)
 
-        self.feedback = tk.Label(translator_panel, textvariable=self.feedback_var, bg=Palette.panel, fg=Palette.accent)
+        self.feedback = ttk.Label(
+            translator_panel, textvariable=self.feedback_var, style="Feedback.TLabel", wraplength=560
+        )
         self.feedback.grid(row=4, column=0, columnspan=2, padx=16, pady=(0, 16), sticky="w")
 
     def on_show(self) -> None:
@@ -379,37 +482,50 @@ class TranslatorFrame(BaseFrame):
         self.feedback_var.set("")
 
     def populate_summary(self) -> None:
-        text_lines = ["Reconnaissance :"]
-        for choice in self.controller.state.recognition_choices:
-            text_lines.append(f"• Série {choice.round_index}: {choice.selection}")
-
-        text_lines.append("\nSaisie en glyphes :")
-        for attempt in self.controller.state.translation_attempts:
-            text_lines.append(f"• {attempt.french_word} → {attempt.typed_glyphs or '<vide>'}")
+        choices = self.state.recognition_choices
+        attempts = self.state.translation_attempts
+        sig = (tuple(choices), tuple(attempts))
+        if sig == self._summary_sig:
+            return
+        self._summary_sig = sig
 
-        summary_text = "\n".join(text_lines)
-        self.summary_text.config(state=tk.NORMAL)
+        rec = "\n".join(f"• Série {c.round_index}: {c.selection}" for c in choices)
+        tr = "\n".join(f"• {a.french_word} → {a.typed_glyphs or '<vide>'}" for a in attempts)
+        self.summary_text.config(state=NORMAL)
         self.summary_text.delete("1.0", tk.END)
-        self.summary_text.insert(tk.END, summary_text)
-        self.summary_text.config(state=tk.DISABLED)
+        self.summary_text.insert(tk.END, SUMMARY_TEMPLATE.format(rec=rec, tr=tr))
+        self.summary_text.config(state=DISABLED)
+
+    def _normalize_custom(self, *_args: object) -> None:
+        self.custom_norm = self.custom_var.get().strip()
+
+    def _normalize_french(self, *_args: object) -> None:
+        self.french_norm = self.french_var.get().strip().casefold()
 
     def translate_custom(self) -> None:
-        glyphs = self.custom_var.get().strip()
+        glyphs = self.custom_norm
         if not glyphs:
             self.feedback_var.set("Saisissez un mot en glyphes.")
             return
-        french = self.controller.state.reverse_dictionary().get(glyphs)
+        french = self.state.reverse_dictionary().get(glyphs)
         if french:
             self.feedback_var.set(f"→ {french}")
+            return
+        matches = self.state.glyph_prefix_matches(glyphs)
+        if matches:
+            candidates = ", ".join(f"{word} ({full})" for full, word in matches[:MAX_PREFIX_CANDIDATES])
+            if len(matches) > MAX_PREFIX_CANDIDATES:
+                candidates += ", …"
+            self.feedback_var.set(f"→ {candidates} ?")
         else:
             self.feedback_var.set("Aucune correspondance trouvée dans la liste fournie.")
 
     def translate_french(self) -> None:
-        french = self.french_var.get().strip().lower()
+        french = self.french_norm
         if not french:
             self.feedback_var.set("Saisissez un mot français.")
             return
-        glyphs = self.controller.state.dictionary.get(french)
+        glyphs = self.state.folded_dictionary().get(french)
         if glyphs:
             self.feedback_var.set(f"→ {glyphs}")
         else:
@@ -421,35 +537,48 @@ class TranslatorFrame(BaseFrame):
 # ----------------------------
 
 class TranslationAlienApp(tk.Tk):
-    def __init__(self, state: GameState):
+    def __init__(self, state: GameState, ready: bool = True):
         super().__init__()
         self.state = state
+        self.ready = ready
         self.title("Translation Alien")
         self.geometry("720x780")
         self.resizable(False, False)
 
-        base_font = tkfont.Font(family="Segoe UI", size=12)
-        self.heading_font = tkfont.Font(family=base_font.actual("family"), size=18, weight="bold")
+        base_font = tkfont.Font(family=FONT_FAMILY, size=12)
+        self.heading_font = tkfont.Font(family=FONT_FAMILY, size=18, weight="bold")
         apply_futuristic_theme(self, base_font)
 
-        container = tk.Frame(self, bg=Palette.bg)
-        container.pack(fill="both", expand=True)
+        self._container = tk.Frame(self)
+        self._container.pack(fill="both", expand=True)
+        self._container.rowconfigure(0, weight=1)
+        self._container.columnconfigure(0, weight=1)
 
-        self.frames: Dict[str, BaseFrame] = {}
-        for key, frame_cls in {
+        self._frame_classes: Dict[str, type] = {
             "start": StartFrame,
             "recognition": RecognitionFrame,
             "translation": TranslationFrame,
             "translator": TranslatorFrame,
-        }.items():
-            frame = frame_cls(container, self)
-            self.frames[key] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
+        }
+        self.frames: Dict[str, BaseFrame] = {}
 
         self.show_frame("start")
 
+    def set_state(self, state: GameState) -> None:
+        self.state = state
+        self.ready = True
+        start = self.frames.get("start")
+        if start is not None:
+            start.start_button.config(state=NORMAL)  # type: ignore[attr-defined]
+
     def show_frame(self, name: str) -> None:
-        frame = self.frames[name]
+        frame = self.frames.get(name)
+        if frame is None:
+            frame = self._frame_classes[name](self._container, self)
+            frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[name] = frame
+        # The state may have been swapped by set_state since the frame was built.
+        frame.state = self.state
         if hasattr(frame, "on_show"):
             frame.on_show()  # type: ignore[attr-defined]
         frame.tkraise()
@@ -492,18 +621,45 @@ def load_state() -> GameState:
         },
     )
 
-    return GameState(
+    state = GameState(
         font_label=recognition_data.get("font_label", "HoloGlyph"),
         recognition_rounds=recognition_data.get("rounds", []),
         practice_words=lexicon_data.get("practice_words", []),
-        dictionary=lexicon_data.get("dictionary", {}),
     )
+    state.set_dictionary(lexicon_data.get("dictionary", {}))
+    return state
 
 
 def main() -> None:
-    state = load_state()
-    app = TranslationAlienApp(state)
+    # Parse the data files off the UI thread so the start screen paints
+    # immediately; the start button is enabled once the state is hydrated.
+    results: List[GameState] = []
+    errors: List[BaseException] = []
+
+    def load() -> None:
+        try:
+            results.append(load_state())
+        except BaseException as exc:
+            errors.append(exc)
+
+    loader = threading.Thread(target=load, daemon=True)
+    loader.start()
+    app = TranslationAlienApp(GameState(), ready=False)
+
+    def check_loaded() -> None:
+        if loader.is_alive():
+            app.after(50, check_loaded)
+        elif errors:
+            # Exceptions raised inside Tk callbacks are only logged, so close
+            # the window and re-raise from main once mainloop returns.
+            app.destroy()
+        else:
+            app.set_state(results[0])
+
+    app.after(50, check_loaded)
     app.mainloop()
+    if errors:
+        raise errors[0]
 
 
 if __name__ == "__main__":